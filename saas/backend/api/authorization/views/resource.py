@@ -8,6 +8,8 @@ Unless required by applicable law or agreed to in writing, software distributed
 an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 specific language governing permissions and limitations under the License.
 """
+from typing import Any, Dict, Tuple
+
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers, status
 from rest_framework.views import APIView
@@ -24,6 +26,13 @@ from ..permissions import AuthorizationAPIPermission
 from ..serializers import AuthBatchInstanceSLZ, AuthBatchPathSLZ, AuthInstanceSLZ, AuthPathSLZ
 
 
+def _parse_common_data(data: Dict[str, Any]) -> Tuple[str, Subject, str, int]:
+    """
+    解析授权/回收API的公共参数: operate, subject, system_id, expired_at
+    """
+    return data["operate"], Subject(**data["subject"]), data["system"], data["expired_at"]
+
+
 class AuthInstanceView(AuthViewMixin, APIView):
     """
     单个资源授权回收
@@ -50,10 +59,7 @@ class AuthInstanceView(AuthViewMixin, APIView):
 
         data = serializer.validated_data
 
-        operate = data["operate"]
-        subject = Subject(**data["subject"])
-        system_id = data["system"]
-        expired_at = data["expired_at"]
+        operate, subject, system_id, expired_at = _parse_common_data(data)
         action_id = data["action"]["id"]
         resources = data["resources"]
 
@@ -94,10 +100,7 @@ class AuthPathView(AuthViewMixin, APIView):
 
         data = serializer.validated_data
 
-        operate = data["operate"]
-        subject = Subject(**data["subject"])
-        system_id = data["system"]
-        expired_at = data["expired_at"]
+        operate, subject, system_id, expired_at = _parse_common_data(data)
         action_id = data["action"]["id"]
         resources = data["resources"]
 
@@ -138,10 +141,7 @@ class AuthBatchInstanceView(AuthViewMixin, APIView):
 
         data = serializer.validated_data
 
-        operate = data["operate"]
-        subject = Subject(**data["subject"])
-        system_id = data["system"]
-        expired_at = data["expired_at"]
+        operate, subject, system_id, expired_at = _parse_common_data(data)
         action_ids = [a["id"] for a in data["actions"]]
         resources = data["resources"]
 
@@ -182,10 +182,7 @@ class AuthBatchPathView(AuthViewMixin, APIView):
 
         data = serializer.validated_data
 
-        operate = data["operate"]
-        subject = Subject(**data["subject"])
-        system_id = data["system"]
-        expired_at = data["expired_at"]
+        operate, subject, system_id, expired_at = _parse_common_data(data)
         action_ids = [a["id"] for a in data["actions"]]
         resources = data["resources"]
 
@@ -13,18 +13,15 @@ import re
 # 只需要判断 v1 - v9 的 open api，一般不会有超过9个版本的Open API
 OPEN_API_PATH_PATTERN = re.compile(r"/api/v\d/open/")
 
+# 请求路径带有 SITE_URL 前缀，所以只能判断是否包含，无法使用前缀匹配
+V1_OPEN_API_PATH = "/api/v1/open/"
+
 
 def is_open_api_request_path(path: str) -> bool:
     """检查路径是否为open api请求的路径"""
     return OPEN_API_PATH_PATTERN.search(path) is not None
 
 
-def _is_certain_version_open_api_request_path(path: str, version: int) -> bool:
-    """判断是否某个固定版本OpenAPI路径"""
-    version_open_api_path = f"/api/v{version}/open/"
-    return version_open_api_path in path
-
-
 def is_v1_open_api_request_path(path: str) -> bool:
     """判断是否V1 Open API请求"""
-    return _is_certain_version_open_api_request_path(path, version=1)
+    return V1_OPEN_API_PATH in path
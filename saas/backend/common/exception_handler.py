@@ -41,46 +41,55 @@ from .base import is_open_api_request_path, is_v1_open_api_request_path
 
 logger = logging.getLogger("app")
 
+# NOTE: v1 openapi 为了兼容调用方使用习惯, 除以下error外，其他error的status code 默认返回 200
+V1_OPEN_API_IGNORE_ERROR_CODES = frozenset(
+    {
+        error_codes.UNAUTHORIZED.code_num,
+        error_codes.FORBIDDEN.code_num,
+        error_codes.NOT_FOUND_ERROR.code_num,
+        error_codes.SYSTEM_ERROR.code_num,
+    }
+)
+
 
 def _one_line_error(exc):
     """
     从 serializer ValidationError 中抽取一行的错误消息
     """
-    detail = exc.detail
-
-    # handle ValidationError("error")
-    if isinstance(detail, list):
-        return detail[0]
-
-    key, error = next(iter(detail.items()))
-    if isinstance(error, list):
-        error = error[0]
-    elif isinstance(error, dict) and getattr(exc, "serializer", None):
-        if key in getattr(exc.serializer, "fields", {}):
-            field = exc.serializer.fields[key]
+    detail, serializer = exc.detail, getattr(exc, "serializer", None)
+
+    # 逐层深入嵌套的 serializer / ListField 错误，直到取得最内层的第一个错误
+    while True:
+        # handle ValidationError("error")
+        if isinstance(detail, list):
+            return detail[0]
+
+        key = next(iter(detail))
+        error = detail[key]
+        fields = getattr(serializer, "fields", {})
+        if isinstance(error, list):
+            error = error[0]
+        elif isinstance(error, dict) and serializer:
+            field = fields.get(key)
             if isinstance(field, ListField):  # 处理嵌套的ListField
-                _, child = next(iter(error.items()))
-                child_error = ValidationError(child)
-                child_error.serializer = field.child
-                return _one_line_error(child_error)
-            elif isinstance(field, Serializer):  # 处理嵌套的serializer
-                child_error = ValidationError(error)
-                child_error.serializer = field
-                return _one_line_error(child_error)
-
-        if isinstance(exc.serializer, ListField):
-            _, child = next(iter(detail.items()))
-            child_error = ValidationError(child)
-            child_error.serializer = exc.serializer.child
-            return _one_line_error(child_error)
+                detail, serializer = next(iter(error.values())), field.child
+                continue
+            if isinstance(field, Serializer):  # 处理嵌套的serializer
+                detail, serializer = error, field
+                continue
+            if isinstance(serializer, ListField):  # 当前层为ListField，error即为第一个子元素的错误
+                detail, serializer = error, serializer.child
+                continue
+
+        break
 
     # handle non_field_errors, 非单个字段错误
     if key == drf_api_settings.NON_FIELD_ERRORS_KEY:
         return error
 
     # handle custom is_valid, show label in error
-    if getattr(exc, "serializer", None) and key in exc.serializer.fields:
-        key = exc.serializer.fields[key].label
+    if serializer and key in fields:
+        key = fields[key].label
 
     return f"{key}: {error}"
 
@@ -131,16 +140,18 @@ def exception_handler(exc, context):
         error = error_codes.SYSTEM_ERROR
 
         # 用户未主动捕获的异常
-        logger.error(
-            (
-                """catch unhandled exception, stack->[%s], request url->[%s], """
-                """request method->[%s] request params->[%s]"""
-            ),
-            traceback.format_exc(),
-            request.path,
-            request.method,
-            json.dumps(getattr(request, request.method, None)),
-        )
+        # NOTE: 堆栈和请求参数的格式化开销较大，仅在日志级别允许输出时才计算
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                (
+                    """catch unhandled exception, stack->[%s], request url->[%s], """
+                    """request method->[%s] request params->[%s]"""
+                ),
+                traceback.format_exc(),
+                request.path,
+                request.method,
+                json.dumps(getattr(request, request.method, None)),
+            )
 
         # 记录debug信息
         log_api_error_trace(request, True)
@@ -152,19 +163,11 @@ def exception_handler(exc, context):
         if settings.DEBUG:
             return
 
-    # NOTE: v1 openapi 为了兼容调用方使用习惯, 除以下error外，其他error的status code 默认返回 200
-    ignore_error_codes = {
-        error_codes.UNAUTHORIZED.code_num,
-        error_codes.FORBIDDEN.code_num,
-        error_codes.NOT_FOUND_ERROR.code_num,
-        error_codes.SYSTEM_ERROR.code_num,
-    }
-
     status_code = error.status_code
     if (
         is_v1_open_api_request_path(request.path)
         and isinstance(error, APIError)
-        and error.code_num not in ignore_error_codes
+        and error.code_num not in V1_OPEN_API_IGNORE_ERROR_CODES
     ):
         status_code = status.HTTP_200_OK
 
@@ -74,5 +74,7 @@ class LanguageMiddleware(MiddlewareMixin):
         # 如果是 openapi 请求, 设置默认语言为 english
         # openapi 的错误信息返回为英文
         if is_open_api_request_path(request.path):
-            translation.activate(DjangoLanguageEnum.EN.value)
-            request.LANGUAGE_CODE = translation.get_language()
+            # LocaleMiddleware 已按请求激活了语言，已是 english 则无需重复激活
+            if translation.get_language() != DjangoLanguageEnum.EN.value:
+                translation.activate(DjangoLanguageEnum.EN.value)
+            request.LANGUAGE_CODE = DjangoLanguageEnum.EN.value
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-权限中心(BlueKing-IAM) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from backend.common.exception_handler import _one_line_error
+
+
+class ChildSLZ(serializers.Serializer):
+    id = serializers.CharField(label="子ID")
+
+
+class ParentSLZ(serializers.Serializer):
+    name = serializers.CharField(label="名称")
+    child = ChildSLZ(label="子对象")
+    children = serializers.ListField(label="子对象列表", child=ChildSLZ(label="子对象"))
+
+
+def _validation_error(detail, serializer=None):
+    error = ValidationError(detail)
+    error.serializer = serializer
+    return error
+
+
+class TestOneLineError(TestCase):
+    def test_list_detail(self):
+        """ValidationError("error")"""
+        self.assertEqual(_one_line_error(ValidationError("error")), "error")
+
+    def test_field_error(self):
+        """单个字段错误，显示字段label"""
+        exc = _validation_error({"name": ["This field is required."]}, ParentSLZ())
+        self.assertEqual(_one_line_error(exc), "名称: This field is required.")
+
+    def test_non_field_error(self):
+        """非单个字段错误"""
+        exc = _validation_error({"non_field_errors": ["invalid"]}, ParentSLZ())
+        self.assertEqual(_one_line_error(exc), "invalid")
+
+    def test_nested_serializer_error(self):
+        """嵌套serializer错误"""
+        exc = _validation_error({"child": {"id": ["This field is required."]}}, ParentSLZ())
+        self.assertEqual(_one_line_error(exc), "子ID: This field is required.")
+
+    def test_nested_list_field_error(self):
+        """嵌套ListField错误"""
+        exc = _validation_error({"children": {1: {"id": ["This field is required."]}}}, ParentSLZ())
+        self.assertEqual(_one_line_error(exc), "子ID: This field is required.")